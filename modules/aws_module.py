@@ -1,28 +1,274 @@
 # modules/aws_module.py
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 import boto3
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
+import botocore.session
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, DataNotFoundError, NoCredentialsError, PartialCredentialsError, ClientError
+from botocore.loaders import create_loader
 import logging
+from utils.file_cache import TimestampedCache
 
 logger = logging.getLogger(__name__)
 
+# Shared client configuration: a larger keep-alive connection pool so repeated
+# calls reuse TLS connections, bounded timeouts and adaptive retries for throttling.
+# botocore always sets TCP_NODELAY on its sockets and tcp_keepalive adds SO_KEEPALIVE,
+# so small API requests are not held back by Nagle's algorithm.
+# aws_module_async builds its AioConfig from the same options.
+_CLIENT_OPTIONS = {
+    "max_pool_connections": 64,
+    "tcp_keepalive": True,
+    "connect_timeout": 3,
+    "read_timeout": 15,
+    "retries": {"mode": "adaptive", "max_attempts": 10},
+}
+_CLIENT_CONFIG = Config(**_CLIENT_OPTIONS)
+
+# S3 clients sign with SigV4 and use virtual-hosted addressing so a single global
+# client can reach buckets in any region
+_SERVICE_CONFIGS = {
+    "s3": _CLIENT_CONFIG.merge(Config(signature_version="s3v4", s3={"addressing_style": "virtual"})),
+}
+
+# Alternate contact types managed by the AWS Account API
+_CONTACT_TYPES = ("BILLING", "OPERATIONS", "SECURITY")
+
+# Probe clients fail fast so a quick "no" does not turn into seconds of retries
+_PROBE_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=10,
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+# Target SQS queue ARN for S3 notifications: <prefix>-<account>-<region> in the bucket's region
+_QUEUE_ARN_FMT = "arn:aws:sqs:{region}:{account_id}:{prefix}-{account_id}-{region}".format
+
+# Static part of the S3 notification queue configuration; only QueueArn varies per bucket
+_NOTIFICATION_QUEUE_TEMPLATE = {
+    "Events": [
+        "s3:ReducedRedundancyLostObject",
+        "s3:Replication:OperationFailedReplication"
+    ],
+    "Filter": {
+        "Key": {
+            "FilterRules": [
+                {"Name": "prefix", "Value": ""},
+                {"Name": "suffix", "Value": ""},
+            ]
+        }
+    },
+}
+
+# One botocore data loader shared by every session, so service models are parsed once per
+# process rather than once per account profile; built on first use by _shared_loader
+_loader = None
+
+# Services whose models are preloaded when AWS_EAGER_INIT=1
+_EAGER_SERVICES = ("sts", "organizations", "account", "s3")
+
+# Bucket regions persisted between runs, keyed by "<account_id>/<bucket_name>"
+_BUCKET_REGION_CACHE = "bucket_region.json"
+_BUCKET_REGION_TTL = 24 * 60 * 60
+_bucket_regions = None
+_BUCKET_REGION_LOCK = threading.Lock()
+
+# boto3 sessions are not thread-safe, so client creation is serialized
+_CLIENT_LOCK = threading.Lock()
+
+@dataclass(slots=True)
+class Contacts:
+    """
+    Alternate contact information for an AWS account.
+
+    Attributes:
+        account_id (str): The AWS account ID.
+        billing (dict): The billing contact, or None if not set.
+        operations (dict): The operations contact, or None if not set.
+        security (dict): The security contact, or None if not set.
+        error (str): The error code if the contacts could not be retrieved, otherwise None.
+    """
+    account_id: str
+    billing: dict | None = None
+    operations: dict | None = None
+    security: dict | None = None
+    error: str | None = None
+
+def contacts_to_columns(contacts):
+    """
+    Converts a list of Contacts into column lists, e.g. for building a pandas DataFrame.
+
+    Args:
+        contacts (list): The Contacts to convert.
+
+    Returns:
+        dict: A mapping of field name to the list of values for that field.
+    """
+    return {field.name: [getattr(contact, field.name) for contact in contacts] for field in fields(Contacts)}
+
+def _shared_loader(botocore_session):
+    """
+    Returns the process-wide botocore data loader, building it on first use from the
+    session's data_path setting (AWS_DATA_PATH or the config file), as botocore does.
+    Callers must hold _CLIENT_LOCK.
+
+    Args:
+        botocore_session (botocore.session.Session): The session whose settings are used.
+
+    Returns:
+        botocore.loaders.Loader: The shared loader.
+    """
+    global _loader
+    if _loader is None:
+        _loader = create_loader(botocore_session.get_config_variable("data_path"))
+    return _loader
+
+@functools.lru_cache(maxsize=None)
+def _session(profile, region):
+    """
+    Returns a cached boto3 session for the given profile and region. Callers must hold
+    _CLIENT_LOCK.
+
+    Args:
+        profile (str): The AWS profile name (the account ID in this project).
+        region (str): The AWS region to use, or None for the profile default.
+
+    Returns:
+        boto3.Session: A session shared by every caller with the same arguments.
+    """
+    botocore_session = botocore.session.Session(profile=profile)
+    loader = _shared_loader(botocore_session)
+    # Registered before boto3 wraps the session so boto3's own loader is the shared one
+    botocore_session.register_component("data_loader", loader)
+    session = boto3.Session(botocore_session=botocore_session, region_name=region)
+    # boto3 appends its data path for every session; keep one copy of each path
+    loader.search_paths[:] = list(dict.fromkeys(loader.search_paths))
+    return session
+
+@functools.lru_cache(maxsize=None)
+def _client(profile, region, service, probe=False):
+    """
+    Returns a cached boto3 client so sessions, endpoint data and connections are reused.
+
+    Args:
+        profile (str): The AWS profile name (the account ID in this project).
+        region (str): The AWS region to use, or None for the profile default.
+        service (str): The AWS service name, e.g. "s3".
+        probe (bool): Use short timeouts and few retries for existence/location probes.
+
+    Returns:
+        botocore.client.BaseClient: The client for the service.
+    """
+    with _CLIENT_LOCK:
+        config = _SERVICE_CONFIGS.get(service, _CLIENT_CONFIG)
+        if probe:
+            config = config.merge(_PROBE_CONFIG)
+        return _session(profile, region).client(service, config=config)
+
+class AwsBatcher:
+    """
+    Runs leaf AWS calls on one shared, bounded thread pool, so concurrent callers do not each
+    spin up their own pool and the total number of requests in flight stays bounded. Calls
+    submitted from one of the pool's own threads run inline instead of queueing behind the
+    task that is waiting for them.
+
+    Args:
+        max_workers (int): The maximum number of calls in flight at once.
+    """
+
+    _THREAD_NAME_PREFIX = "aws-batcher"
+
+    def __init__(self, max_workers=32):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self._THREAD_NAME_PREFIX)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedules a call on the shared pool, or runs it immediately when called from the pool.
+
+        Args:
+            fn (callable): The function to call.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result of the call.
+        """
+        if threading.current_thread().name.startswith(self._THREAD_NAME_PREFIX):
+            future = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+        return self._executor.submit(fn, *args, **kwargs)
+
+# Shared by the leaf API calls below
+_BATCHER = AwsBatcher()
+
+@functools.lru_cache(maxsize=256)
+def _caller_identity(profile, region):
+    """
+    Returns the STS caller identity for a profile, cached for the life of the process.
+    Failed calls raise and are not cached, so they are retried on the next call.
+
+    Args:
+        profile (str): The AWS profile name (the account ID in this project).
+        region (str): The AWS region to use.
+
+    Returns:
+        dict: The get_caller_identity response.
+    """
+    return _client(profile, region, "sts").get_caller_identity()
+
 def verify_aws_connection(account_id, region):
     try:
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("sts")
-        caller_identity = client.get_caller_identity()
+        client = _client(account_id, region, "sts")
+        caller_identity = _caller_identity(account_id, region)
 
         if caller_identity["Account"] == account_id:
-            logger.info("AWS connection verified successfully.")
-            logger.info(f"Region: {session.region_name}")
-            logger.info(f"Account ID: {caller_identity['Account']}")
-            logger.info(f"User ARN: {caller_identity['Arn']}")
+            logger.info(
+                "AWS connection verified successfully. Region: %s, Account ID: %s, User ARN: %s",
+                client.meta.region_name,
+                caller_identity["Account"],
+                caller_identity["Arn"],
+            )
         else:
             logger.warning("Connected to a different account than expected.")
     except (NoCredentialsError, PartialCredentialsError) as e:
-        logger.error(f"Failed to connect to AWS: {e}")
-    except Exception as e:
-        logger.error(f"An error occurred while connecting to AWS: {e}")
+        logger.error("Failed to connect to AWS: %s", e)
+    except (BotoCoreError, ClientError) as e:
+        logger.error("An error occurred while connecting to AWS: %s", e)
+
+
+def iter_active_accounts(account_id, region):
+    """
+    Yields the active accounts in an AWS Organization one page at a time.
+
+    Args:
+        account_id (str): The AWS account ID to use as the profile name.
+        region (str): The AWS region to use.
 
+    Yields:
+        dict: The details of each active account.
+
+    Raises:
+        botocore.exceptions.ClientError: If the accounts cannot be listed.
+    """
+    client = _client(account_id, region, "organizations")
+    active = "ACTIVE"
+
+    # Follow NextToken directly rather than through the paginator machinery
+    response = client.list_accounts(MaxResults=20)
+    while True:
+        yield from [account for account in response["Accounts"] if account["Status"] == active]
+        next_token = response.get("NextToken")
+        if not next_token:
+            break
+        response = client.list_accounts(MaxResults=20, NextToken=next_token)
 
 def list_active_accounts(account_id, region):
     """
@@ -36,25 +282,35 @@ def list_active_accounts(account_id, region):
         list: A list of dictionaries containing active account details.
     """
     try:
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("organizations")
+        accounts = list(iter_active_accounts(account_id, region))
 
-        accounts = []
-        paginator = client.get_paginator("list_accounts")
-        for page in paginator.paginate():
-            for account in page["Accounts"]:
-                if account["Status"] == "ACTIVE":
-                    accounts.append(account)
-
-        logger.info(f"Retrieved {len(accounts)} active accounts from AWS Organizations.")
+        logger.info("Retrieved %d active accounts from AWS Organizations.", len(accounts))
         return accounts
-    except client.exceptions.AWSOrganizationsNotInUseException as e:
-        logger.error("The AWS Organizations service is not available in this account.")
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "AWSOrganizationsNotInUseException":
+            logger.error("The AWS Organizations service is not available in this account.")
+        else:
+            logger.error("An error occurred while retrieving active accounts: %s", e)
         return []
-    except Exception as e:
-        logger.error(f"An error occurred while retrieving active accounts: {e}")
+    except BotoCoreError as e:
+        logger.error("An error occurred while retrieving active accounts: %s", e)
         return []
 
+def for_each_account(accounts, fn, max_workers=16):
+    """
+    Runs a function for every account on a bounded thread pool.
+
+    Args:
+        accounts (list): The accounts to process, e.g. from list_active_accounts.
+        fn (callable): Function called with a single account.
+        max_workers (int): The maximum number of accounts processed at once.
+
+    Returns:
+        list: The results of fn, in the same order as accounts.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fn, accounts))
+
 def get_alternate_contacts(account_id, region):
     """
     Retrieves alternate contact information for a given AWS account.
@@ -64,42 +320,41 @@ def get_alternate_contacts(account_id, region):
         region (str): The AWS region to use.
 
     Returns:
-        dict: A dictionary containing alternate contact information.
+        Contacts: The alternate contact information, with error set if it could not be retrieved.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("account")
+        # Get the cached client
+        client = _client(account_id, region, "account")
 
         # Retrieve alternate contacts
         def fetch_contact(contact_type):
             try:
                 return client.get_alternate_contact(AlternateContactType=contact_type).get("AlternateContact", {})
             except client.exceptions.ResourceNotFoundException:
-                logger.info(f"No {contact_type.lower()} contact set for account {account_id}.")
+                logger.info("No %s contact set for account %s.", contact_type.lower(), account_id)
                 return None
 
-        billing_contact = fetch_contact("BILLING")
-        operations_contact = fetch_contact("OPERATIONS")
-        security_contact = fetch_contact("SECURITY")
+        # The three lookups are independent, so they run concurrently on the shared client
+        futures = [_BATCHER.submit(fetch_contact, contact_type) for contact_type in _CONTACT_TYPES]
+        billing_contact, operations_contact, security_contact = (future.result() for future in futures)
 
-        return {
-            "AccountID": account_id,
-            "BillingContact": billing_contact,
-            "OperationsContact": operations_contact,
-            "SecurityContact": security_contact,
-        }
+        return Contacts(
+            account_id=account_id,
+            billing=billing_contact,
+            operations=operations_contact,
+            security=security_contact,
+        )
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "AccessDeniedException":
-            logger.error(f"Access denied while retrieving contacts for account {account_id}.")
-            return {"AccountID": account_id, "Error": "AccessDenied"}
+            logger.error("Access denied while retrieving contacts for account %s.", account_id)
+            return Contacts(account_id=account_id, error="AccessDenied")
         else:
-            logger.error(f"ClientError while retrieving contacts for account {account_id}: {e}")
-            return {"AccountID": account_id, "Error": error_code}
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while retrieving contacts for account {account_id}: {e}")
-        return {"AccountID": account_id, "Error": str(e)}
+            logger.error("ClientError while retrieving contacts for account %s: %s", account_id, e)
+            return Contacts(account_id=account_id, error=error_code)
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving contacts for account %s: %s", account_id, e)
+        return Contacts(account_id=account_id, error=str(e))
 
 def set_alternate_contacts(account_id, region, config):
     """
@@ -114,9 +369,8 @@ def set_alternate_contacts(account_id, region, config):
         bool: True if all contacts were set successfully, False otherwise.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("account")
+        # Get the cached client
+        client = _client(account_id, region, "account")
 
         # Helper function to set a single contact type
         def set_contact(contact_type, name, email, phone, title):
@@ -127,44 +381,72 @@ def set_alternate_contacts(account_id, region, config):
                 PhoneNumber=phone,
                 Title=title,
             )
-            logger.info(f"Successfully set {contact_type.lower()} contact for account {account_id}.")
-
-        # Set billing contact
-        set_contact(
-            "BILLING",
-            config["aws"]["alternate_contact_billing_name"],
-            config["aws"]["alternate_contact_billing_email"],
-            config["aws"]["alternate_contact_billing_phone"],
-            config["aws"]["alternate_contact_billing_title"],
-        )
-
-        # Set operations contact
-        set_contact(
-            "OPERATIONS",
-            config["aws"]["alternate_contact_operations_name"],
-            config["aws"]["alternate_contact_operations_email"],
-            config["aws"]["alternate_contact_operations_phone"],
-            config["aws"]["alternate_contact_operations_title"],
-        )
-
-        # Set security contact
-        set_contact(
-            "SECURITY",
-            config["aws"]["alternate_contact_security_name"],
-            config["aws"]["alternate_contact_security_email"],
-            config["aws"]["alternate_contact_security_phone"],
-            config["aws"]["alternate_contact_security_title"],
-        )
+            logger.info("Successfully set %s contact for account %s.", contact_type.lower(), account_id)
+
+        # Set billing, operations and security contacts concurrently
+        futures = [
+            _BATCHER.submit(
+                set_contact,
+                contact_type,
+                config["aws"][f"alternate_contact_{contact_type.lower()}_name"],
+                config["aws"][f"alternate_contact_{contact_type.lower()}_email"],
+                config["aws"][f"alternate_contact_{contact_type.lower()}_phone"],
+                config["aws"][f"alternate_contact_{contact_type.lower()}_title"],
+            )
+            for contact_type in _CONTACT_TYPES
+        ]
+        # Surface the first failure, if any
+        for future in futures:
+            future.result()
 
         return True
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"Failed to set alternate contacts for account {account_id}: {error_code}")
+        logger.error("Failed to set alternate contacts for account %s: %s", account_id, error_code)
         return False
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while setting alternate contacts for account {account_id}: {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while setting alternate contacts for account %s: %s", account_id, e)
         return False
 
+def _persisted_bucket_regions():
+    """
+    Loads the on-disk bucket region cache on first use.
+
+    Returns:
+        TimestampedCache: Maps "<account_id>/<bucket_name>" to the bucket's region.
+    """
+    global _bucket_regions
+    with _BUCKET_REGION_LOCK:
+        if _bucket_regions is None:
+            _bucket_regions = TimestampedCache(_BUCKET_REGION_CACHE, _BUCKET_REGION_TTL)
+        return _bucket_regions
+
+@functools.lru_cache(maxsize=4096)
+def _get_bucket_location(account_id, bucket_name):
+    """
+    Looks up the region of an S3 bucket. A bucket's region never changes, so successful
+    lookups are cached in memory and on disk for _BUCKET_REGION_TTL; failures raise and
+    are not cached.
+
+    Args:
+        account_id (str): The AWS account ID to use as the profile name.
+        bucket_name (str): The name of the S3 bucket.
+
+    Returns:
+        str: The AWS region where the bucket resides.
+    """
+    key = f"{account_id}/{bucket_name}"
+    persisted = _persisted_bucket_regions()
+    location = persisted.get(key)
+    if location is not None:
+        return location
+
+    client = _client(account_id, None, "s3", probe=True)
+    # Handle default region for buckets with no location constraint
+    location = client.get_bucket_location(Bucket=bucket_name).get("LocationConstraint") or "us-east-1"
+    persisted.set(key, location)
+    return location
+
 def get_s3_bucket_region(account_id, bucket_name):
     """
     Retrieves the AWS region for a specified S3 bucket.
@@ -177,24 +459,50 @@ def get_s3_bucket_region(account_id, bucket_name):
         str: The AWS region where the bucket resides, or an error message if the region cannot be determined.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id)
-        client = session.client("s3")
-
-        # Get the bucket location
-        location = client.get_bucket_location(Bucket=bucket_name).get("LocationConstraint")
-        # Handle default region for buckets with no location constraint
-        if location is None:
-            return "us-east-1"
-        return location
+        return _get_bucket_location(account_id, bucket_name)
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"Failed to retrieve region for bucket '{bucket_name}' in account {account_id}: {error_code}")
+        logger.error("Failed to retrieve region for bucket '%s' in account %s: %s", bucket_name, account_id, error_code)
         return f"Error: {error_code}"
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while retrieving the region for bucket '{bucket_name}': {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving the region for bucket '%s': %s", bucket_name, e)
         return f"Error: {str(e)}"
 
+@functools.lru_cache(maxsize=None)
+def _describe_region_names(account_id, region):
+    """
+    Lists the names of every AWS region, cached for the life of the process.
+
+    Args:
+        account_id (str): The AWS account ID to use as the profile name.
+        region (str): The AWS region to query.
+
+    Returns:
+        tuple: The region names.
+    """
+    client = _client(account_id, region, "ec2")
+    return tuple(entry["RegionName"] for entry in client.describe_regions(AllRegions=True)["Regions"])
+
+def list_region_names(account_id, region):
+    """
+    Retrieves the names of all AWS regions, including those not enabled in the account.
+
+    Args:
+        account_id (str): The AWS account ID to use as the profile name.
+        region (str): The AWS region to query.
+
+    Returns:
+        list: A list of region names.
+    """
+    try:
+        return list(_describe_region_names(account_id, region))
+    except ClientError as e:
+        logger.error("Failed to retrieve regions for account %s: %s", account_id, e)
+        return []
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving regions for account %s: %s", account_id, e)
+        return []
+
 def get_s3_bucket_names(account_id, region):
     """
     Retrieves the names of all S3 buckets in an AWS account.
@@ -207,19 +515,18 @@ def get_s3_bucket_names(account_id, region):
         list: A list of bucket names.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("s3")
+        # Get the cached client
+        client = _client(account_id, region, "s3")
         
         # Get bucket names
         response = client.list_buckets()
         bucket_names = [bucket["Name"] for bucket in response["Buckets"]]
         return bucket_names
     except ClientError as e:
-        logger.error(f"Failed to retrieve S3 bucket names for account {account_id}: {e}")
+        logger.error("Failed to retrieve S3 bucket names for account %s: %s", account_id, e)
         return []
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while retrieving S3 bucket names for account {account_id}: {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving S3 bucket names for account %s: %s", account_id, e)
         return []
 
 def check_s3_bucket(account_id, region, bucket_name):
@@ -235,24 +542,23 @@ def check_s3_bucket(account_id, region, bucket_name):
         bool: True if the bucket exists, False otherwise.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        client = session.client("s3")
+        # Get the cached client
+        client = _client(account_id, region, "s3", probe=True)
 
         # Check bucket existence
         client.head_bucket(Bucket=bucket_name)
-        logger.debug(f"Bucket '{bucket_name}' exists in account {account_id}.")
+        logger.debug("Bucket '%s' exists in account %s.", bucket_name, account_id)
         return True
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "404":
-            logger.debug(f"Bucket '{bucket_name}' does not exist in account {account_id}.")
+            logger.debug("Bucket '%s' does not exist in account %s.", bucket_name, account_id)
             return False
         else:
-            logger.error(f"Error checking bucket '{bucket_name}' in account {account_id}: {e}")
+            logger.error("Error checking bucket '%s' in account %s: %s", bucket_name, account_id, e)
             return False
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while checking bucket '{bucket_name}' in account {account_id}: {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while checking bucket '%s' in account %s: %s", bucket_name, account_id, e)
         return False
 
 def get_s3_access_logging(account_id, bucket_name):
@@ -267,33 +573,31 @@ def get_s3_access_logging(account_id, bucket_name):
         str: A message indicating whether access logging is configured or the destination bucket if it is.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id)
-        client = session.client("s3")
-
-        # Get the bucket location
-        bucket_region = client.get_bucket_location(Bucket=bucket_name).get("LocationConstraint", "us-east-1")
-        if bucket_region is None:
-            bucket_region = "us-east-1"  # Default for no location constraint
-
-        # Initialize client for the bucket's region
-        regional_client = boto3.Session(profile_name=account_id, region_name=bucket_region).client("s3")
-
-        # Get bucket logging configuration
-        logging_config = regional_client.get_bucket_logging(Bucket=bucket_name)
+        # Get bucket logging configuration through the global client
+        client = _client(account_id, None, "s3")
+        try:
+            logging_config = client.get_bucket_logging(Bucket=bucket_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "PermanentRedirect":
+                raise
+            # Retry once against the bucket's own region, which is cached for later calls
+            bucket_region = get_s3_bucket_region(account_id, bucket_name)
+            if bucket_region.startswith("Error"):
+                return bucket_region
+            logging_config = _client(account_id, bucket_region, "s3").get_bucket_logging(Bucket=bucket_name)
         if "LoggingEnabled" in logging_config:
             target_bucket = logging_config["LoggingEnabled"]["TargetBucket"]
-            logger.debug(f"Access logging is configured for bucket '{bucket_name}' with target bucket '{target_bucket}'.")
+            logger.debug("Access logging is configured for bucket '%s' with target bucket '%s'.", bucket_name, target_bucket)
             return f"Access logging configured. Destination bucket: {target_bucket}"
         else:
-            logger.debug(f"Access logging is not configured for bucket '{bucket_name}'.")
+            logger.debug("Access logging is not configured for bucket '%s'.", bucket_name)
             return "Access Logging Not Configured"
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"Failed to retrieve access logging settings for bucket '{bucket_name}' in account {account_id}: {error_code}")
+        logger.error("Failed to retrieve access logging settings for bucket '%s' in account %s: %s", bucket_name, account_id, error_code)
         return f"Error: {error_code}"
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while checking access logging for bucket '{bucket_name}': {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while checking access logging for bucket '%s': %s", bucket_name, e)
         return f"Error: {str(e)}"
 
 def set_s3_access_logging(account_id, bucket_name, access_logging_bucket):
@@ -309,9 +613,8 @@ def set_s3_access_logging(account_id, bucket_name, access_logging_bucket):
         str: A message indicating whether logging was configured successfully or if there were errors.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id)
-        client = session.client("s3")
+        # Get the cached client
+        client = _client(account_id, None, "s3")
 
         # Get the bucket region
         bucket_region = get_s3_bucket_region(account_id, bucket_name)
@@ -333,14 +636,14 @@ def set_s3_access_logging(account_id, bucket_name, access_logging_bucket):
                 }
             }
         )
-        logger.debug(f"Access logging enabled for bucket '{bucket_name}' with target bucket '{access_logging_bucket}'.")
+        logger.debug("Access logging enabled for bucket '%s' with target bucket '%s'.", bucket_name, access_logging_bucket)
         return f"Access logging configured for bucket '{bucket_name}'. Logs will be stored in '{access_logging_bucket}'."
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"\t\t\tFailed to configure access logging for bucket '{bucket_name}' in account {account_id}: {access_logging_bucket} : {error_code}")
+        logger.error("\t\t\tFailed to configure access logging for bucket '%s' in account %s: %s : %s", bucket_name, account_id, access_logging_bucket, error_code)
         return f"Error: {error_code}"
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while configuring access logging for bucket '{bucket_name}': {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while configuring access logging for bucket '%s': %s", bucket_name, e)
         return f"Error: {str(e)}"
 
 def get_s3_bucket_notifications(account_id, bucket_name, security_event_collection_prefix):
@@ -355,9 +658,8 @@ def get_s3_bucket_notifications(account_id, bucket_name, security_event_collecti
         str: A message indicating whether notifications are enabled or not.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id)
-        client = session.client("s3")
+        # Get the cached client
+        client = _client(account_id, None, "s3")
 
         # Get the bucket notification configuration
         notification_config = client.get_bucket_notification_configuration(Bucket=bucket_name)
@@ -366,20 +668,20 @@ def get_s3_bucket_notifications(account_id, bucket_name, security_event_collecti
         if notification_config.get("TopicConfigurations") or \
            notification_config.get("QueueConfigurations") or \
            notification_config.get("LambdaFunctionConfigurations"):
-            logger.info(f"\tNotifications are enabled for bucket '{bucket_name}'.")
+            logger.info("\tNotifications are enabled for bucket '%s'.", bucket_name)
             return "Notifications enabled"
         else:
-            logger.info(f"\t ~ No notifications are configured for bucket '{bucket_name}', Enabling.")
+            logger.info("\t ~ No notifications are configured for bucket '%s', Enabling.", bucket_name)
             # enable notifications via set_s3_bucket_notifications
             set_s3_bucket_notifications(account_id, bucket_name, security_event_collection_prefix)
 
             return "Notifications Not Enabled"
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"Failed to retrieve notifications for bucket '{bucket_name}' in account {account_id}: {error_code}")
+        logger.error("Failed to retrieve notifications for bucket '%s' in account %s: %s", bucket_name, account_id, error_code)
         return f"Error: {error_code}"
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while retrieving notifications for bucket '{bucket_name}': {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving notifications for bucket '%s': %s", bucket_name, e)
         return f"Error: {str(e)}"
 
 def set_s3_bucket_notifications(account_id, bucket_name, security_event_collection_prefix):
@@ -395,9 +697,8 @@ def set_s3_bucket_notifications(account_id, bucket_name, security_event_collecti
         str: A message indicating whether the notification policy was applied successfully or if there were errors.
     """
     try:
-        # Initialize session and client
-        session = boto3.Session(profile_name=account_id)
-        client = session.client("s3")
+        # Get the cached client
+        client = _client(account_id, None, "s3")
 
         # Get the bucket region
         bucket_region = get_s3_bucket_region(account_id, bucket_name)
@@ -405,38 +706,44 @@ def set_s3_bucket_notifications(account_id, bucket_name, security_event_collecti
             return f"Error: Unable to determine region for bucket {bucket_name}. {bucket_region}"
 
         # Construct the target SQS queue ARN
-        queue_name = f"{security_event_collection_prefix}-{account_id}-{bucket_region}"
-        queue_arn = f"arn:aws:sqs:{bucket_region}:{account_id}:{queue_name}"
+        queue_arn = _QUEUE_ARN_FMT(region=bucket_region, account_id=account_id, prefix=security_event_collection_prefix)
 
         # Apply the notification policy
         client.put_bucket_notification_configuration(
             Bucket=bucket_name,
             NotificationConfiguration={
-                "QueueConfigurations": [
-                    {
-                        "QueueArn": queue_arn,
-                        "Events": [
-                            "s3:ReducedRedundancyLostObject",
-                            "s3:Replication:OperationFailedReplication"
-                        ],
-                        "Filter": {
-                            "Key": {
-                                "FilterRules": [
-                                    {"Name": "prefix", "Value": ""},
-                                    {"Name": "suffix", "Value": ""},
-                                ]
-                            }
-                        },
-                    }
-                ]
+                "QueueConfigurations": [{**_NOTIFICATION_QUEUE_TEMPLATE, "QueueArn": queue_arn}]
             },
         )
-        logger.info(f"\t +++ Notification policy applied to bucket '{bucket_name}' with queue ARN '{queue_arn}'.")
+        logger.info("\t +++ Notification policy applied to bucket '%s' with queue ARN '%s'.", bucket_name, queue_arn)
         return f"Notification policy configured for bucket '{bucket_name}'. Target queue ARN: {queue_arn}."
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        logger.error(f"Failed to apply notification policy for bucket '{bucket_name}' in account {account_id}: {error_code}")
+        logger.error("Failed to apply notification policy for bucket '%s' in account %s: %s", bucket_name, account_id, error_code)
         return f"Error: {error_code}"
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while applying notification policy for bucket '{bucket_name}': {e}")
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while applying notification policy for bucket '%s': %s", bucket_name, e)
         return f"Error: {str(e)}"
+
+def _warm_service_models():
+    """
+    Loads the endpoint data and service models used by this module into the shared loader,
+    so the first real client creation does not pay for parsing them.
+    """
+    try:
+        with _CLIENT_LOCK:
+            loader = _shared_loader(botocore.session.Session())
+    except BotoCoreError as e:
+        logger.debug("Skipping service model preload: %s", e)
+        return
+    loader.load_data("endpoints")
+    loader.load_data("partitions")
+    for service in _EAGER_SERVICES:
+        loader.load_service_model(service, "service-2")
+        try:
+            loader.load_service_model(service, "endpoint-rule-set-1")
+        except DataNotFoundError:
+            pass
+
+if os.environ.get("AWS_EAGER_INIT") == "1":
+    threading.Thread(target=_warm_service_models, name="aws-eager-init", daemon=True).start()
@@ -0,0 +1,147 @@
+# modules/aws_module_async.py
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+from botocore.exceptions import BotoCoreError, ClientError
+
+from modules.aws_module import _CLIENT_OPTIONS, _CONTACT_TYPES, Contacts
+
+logger = logging.getLogger(__name__)
+
+# Same pool, timeout and retry settings as the synchronous clients
+_CLIENT_CONFIG = AioConfig(**_CLIENT_OPTIONS)
+
+class AsyncClients:
+    """
+    Keeps one long-lived aiobotocore client per (account_id, region, service) open for the
+    duration of an ``async with`` block, so concurrent coroutines share connections.
+    """
+
+    def __init__(self):
+        self._stack = AsyncExitStack()
+        self._sessions = {}
+        self._clients = {}
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self._stack.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._clients.clear()
+        return await self._stack.__aexit__(*exc_info)
+
+    async def get(self, account_id, region, service):
+        """
+        Returns the open client for the given account, region and service, creating it on first use.
+
+        Args:
+            account_id (str): The AWS account ID to use as the profile name.
+            region (str): The AWS region to use, or None for the profile default.
+            service (str): The AWS service name, e.g. "s3".
+
+        Returns:
+            aiobotocore.client.AioBaseClient: The client for the service.
+        """
+        key = (account_id, region, service)
+        async with self._lock:
+            if key not in self._clients:
+                if account_id not in self._sessions:
+                    self._sessions[account_id] = AioSession(profile=account_id)
+                self._clients[key] = await self._stack.enter_async_context(
+                    self._sessions[account_id].create_client(service, region_name=region, config=_CLIENT_CONFIG)
+                )
+            return self._clients[key]
+
+async def get_alternate_contacts_async(clients, account_id, region):
+    """
+    Retrieves alternate contact information for a given AWS account.
+
+    Args:
+        clients (AsyncClients): The open client cache.
+        account_id (str): The AWS account ID to use as the profile name.
+        region (str): The AWS region to use.
+
+    Returns:
+        Contacts: The alternate contact information, with error set if it could not be retrieved.
+    """
+    try:
+        client = await clients.get(account_id, region, "account")
+
+        async def fetch_contact(contact_type):
+            try:
+                response = await client.get_alternate_contact(AlternateContactType=contact_type)
+                return response.get("AlternateContact", {})
+            except client.exceptions.ResourceNotFoundException:
+                logger.info("No %s contact set for account %s.", contact_type.lower(), account_id)
+                return None
+
+        billing_contact, operations_contact, security_contact = await asyncio.gather(
+            *(fetch_contact(contact_type) for contact_type in _CONTACT_TYPES)
+        )
+
+        return Contacts(
+            account_id=account_id,
+            billing=billing_contact,
+            operations=operations_contact,
+            security=security_contact,
+        )
+    except ClientError as e:
+        error_code = e.response["Error"]["Code"]
+        if error_code == "AccessDeniedException":
+            logger.error("Access denied while retrieving contacts for account %s.", account_id)
+            return Contacts(account_id=account_id, error="AccessDenied")
+        logger.error("ClientError while retrieving contacts for account %s: %s", account_id, e)
+        return Contacts(account_id=account_id, error=error_code)
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving contacts for account %s: %s", account_id, e)
+        return Contacts(account_id=account_id, error=str(e))
+
+async def get_s3_bucket_region_async(clients, account_id, bucket_name):
+    """
+    Retrieves the AWS region for a specified S3 bucket.
+
+    Args:
+        clients (AsyncClients): The open client cache.
+        account_id (str): The AWS account ID to use as the profile name.
+        bucket_name (str): The name of the S3 bucket.
+
+    Returns:
+        str: The AWS region where the bucket resides, or an error message if the region cannot be determined.
+    """
+    try:
+        client = await clients.get(account_id, None, "s3")
+        response = await client.get_bucket_location(Bucket=bucket_name)
+        # Handle default region for buckets with no location constraint
+        return response.get("LocationConstraint") or "us-east-1"
+    except ClientError as e:
+        error_code = e.response["Error"]["Code"]
+        logger.error("Failed to retrieve region for bucket '%s' in account %s: %s", bucket_name, account_id, error_code)
+        return f"Error: {error_code}"
+    except BotoCoreError as e:
+        logger.error("An unexpected error occurred while retrieving the region for bucket '%s': %s", bucket_name, e)
+        return f"Error: {str(e)}"
+
+async def get_alternate_contacts_for_accounts(account_ids, region, max_concurrency=16):
+    """
+    Retrieves alternate contacts for many accounts concurrently on a single event loop.
+
+    Args:
+        account_ids (list): The AWS account IDs to query.
+        region (str): The AWS region to use.
+        max_concurrency (int): The maximum number of accounts queried at once.
+
+    Returns:
+        list: The Contacts, in the same order as account_ids.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(clients, account_id):
+        async with semaphore:
+            return await get_alternate_contacts_async(clients, account_id, region)
+
+    async with AsyncClients() as clients:
+        return await asyncio.gather(*(fetch(clients, account_id) for account_id in account_ids))
@@ -1,9 +1,13 @@
 # modules/jira_module.py
-import requests
 import logging
 
+from utils.http_session import build_session
+
 logger = logging.getLogger(__name__)
 
+# Module-wide session so repeated calls to Jira reuse pooled connections
+_session = build_session()
+
 def verify_jira_connection(url, user, token):
     '''
     Verify that the Jira connection is successful.
@@ -17,13 +21,13 @@ def verify_jira_connection(url, user, token):
         None
     '''
     try:
-        response = requests.get(
+        response = _session.get(
             f"{url}/rest/api/3/myself",
             auth=(user, token),
         )
         if response.status_code == 200:
             logger.info("Jira connection verified successfully.")
         else:
-            logger.error(f"Failed to connect to Jira: {response.status_code} - {response.text}")
+            logger.error("Failed to connect to Jira: %s - %s", response.status_code, response.text)
     except Exception as e:
-        logger.error(f"Failed to connect to Jira: {e}")
+        logger.error("Failed to connect to Jira: %s", e)
@@ -1,9 +1,23 @@
 # modules/slack_module.py
-import requests
 import logging
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    # orjson is optional; the stdlib encoder produces the same payload
+    import json
+
+    def _dumps(payload):
+        return json.dumps(payload).encode("utf-8")
+
+from utils.http_session import build_session
 
 logger = logging.getLogger(__name__)
 
+# Module-wide session so repeated calls to Slack reuse pooled connections
+_session = build_session()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 def verify_slack_connection(webhook_url):
     '''
     Verify that the Slack connection is successful.
@@ -15,13 +29,14 @@ def verify_slack_connection(webhook_url):
         None
     '''
     try:
-        response = requests.post(
+        response = _session.post(
             webhook_url,
-            json={"text": "Testing Slack integration."},
+            data=_dumps({"text": "Testing Slack integration."}),
+            headers=_JSON_HEADERS,
         )
         if response.status_code == 200:
             logger.info("Slack connection verified successfully.")
         else:
-            logger.error(f"Failed to connect to Slack: {response.status_code} - {response.text}")
+            logger.error("Failed to connect to Slack: %s - %s", response.status_code, response.text)
     except Exception as e:
-        logger.error(f"Failed to connect to Slack: {e}")
+        logger.error("Failed to connect to Slack: %s", e)
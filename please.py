@@ -3,22 +3,11 @@ CLI script to perform various operations on AWS, Jira, and Slack.
 '''
 import logging
 import argparse
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from utils.config_loader import load_config
-from modules.aws_module import (
-    verify_aws_connection,
-    list_active_accounts,
-    get_alternate_contacts,
-    set_alternate_contacts,
-    get_s3_bucket_names,
-    check_s3_bucket,
-    get_s3_access_logging,
-    get_s3_bucket_region,
-    set_s3_access_logging,
-    get_s3_bucket_notifications,
-    set_s3_bucket_notifications,
-)
-from modules.jira_module import verify_jira_connection
-from modules.slack_module import verify_slack_connection
+from utils.file_cache import TimestampedCache, clear_cache, load_cache, save_cache
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +21,50 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logging.getLogger("botocore").setLevel(logging.WARNING)
 
+# Accounts processed concurrently; kept low to stay within AWS API rate limits
+MAX_ACCOUNT_WORKERS = 8
+# Buckets processed concurrently across all accounts
+MAX_BUCKET_WORKERS = 16
+# Account report blocks combined into a single log record
+LOG_BATCH_SIZE = 50
+# Seconds the active account list is reused from the on-disk cache
+ACCOUNTS_CACHE_TTL = 3600
+# On-disk record of buckets last seen with access logging configured
+ACCESS_LOGGING_CACHE = "bucket_access_logging.json"
+# Seconds a bucket's configured access logging is trusted without asking S3 again
+ACCESS_LOGGING_CACHE_TTL = 24 * 60 * 60
+
+def accounts_cache_name(account_id):
+    """
+    Returns the on-disk cache file name for an organization's active accounts.
+    """
+    return f"accounts_{account_id}.json"
+
+@functools.lru_cache(maxsize=4)
+def get_active_accounts(account_id, region):
+    """
+    List active accounts in AWS Organizations, reusing a recent on-disk copy when available.
+
+    Args:
+        account_id (str): The management account ID.
+        region (str): The AWS region to use.
+
+    Returns:
+        accounts (list): List of active accounts in AWS Organizations.
+    """
+    accounts = load_cache(accounts_cache_name(account_id), ACCOUNTS_CACHE_TTL)
+    if accounts is not None:
+        logger.info("Loaded %d active accounts from cache.", len(accounts))
+        return accounts
+
+    from modules.aws_module import list_active_accounts
+
+    accounts = list_active_accounts(account_id=account_id, region=region)
+    # Only cache successful lookups so errors are retried on the next run
+    if accounts:
+        save_cache(accounts_cache_name(account_id), accounts)
+    return accounts
+
 def test_connections(config):
     """
     Run connection tests for AWS, Jira, and Slack.
@@ -46,6 +79,10 @@ def test_connections(config):
         Exception: If any of the connection tests fail.
 
     """
+    from modules.aws_module import verify_aws_connection
+    from modules.jira_module import verify_jira_connection
+    from modules.slack_module import verify_slack_connection
+
     logger.info("Testing AWS Management Account connection...")
     verify_aws_connection(
         account_id=config["aws"]["management_account_id"],
@@ -79,12 +116,14 @@ def list_accounts(config):
         accounts (list): List of active accounts in AWS Organizations.
     """
     logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
+    accounts = get_active_accounts(
         account_id=config["aws"]["management_account_id"],
         region=config["aws"]["default_region"],
     )
-    for account in accounts:
-        logger.info(f"Account ID: {account['Id']}, Name: {account['Name']}, Email: {account['Email']}")
+    # One log record for the whole list rather than one per account
+    lines = [f"Account ID: {account['Id']}, Name: {account['Name']}, Email: {account['Email']}" for account in accounts]
+    if lines:
+        logger.info("\n".join(lines))
 
 def format_contact(contact):
     """
@@ -115,29 +154,68 @@ def get_alternate_contacts_for_all_accounts(config):
     Returns:
         None    
     """
+    from modules.aws_module import for_each_account, get_alternate_contacts
+    try:
+        from modules.aws_module_async import get_alternate_contacts_for_accounts
+    except ImportError:
+        # aiobotocore is optional; fall back to the threaded implementation
+        get_alternate_contacts_for_accounts = None
+
+    management_account_id = config["aws"]["management_account_id"]
+    region = config["aws"]["default_region"]
+
     logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
-        account_id=config["aws"]["management_account_id"],
-        region=config["aws"]["default_region"],
+    accounts = get_active_accounts(
+        account_id=management_account_id,
+        region=region,
     )
 
-    logger.info(f"Found {len(accounts)} active accounts. Querying alternate contacts...\n")
-    for account in accounts:
-        logger.info(f"Retrieving alternate contacts for account {account['Id']} ({account['Name']})...\n")
-        contacts = get_alternate_contacts(
+    logger.info("Found %d active accounts. Querying alternate contacts...\n", len(accounts))
+
+    def log_fetch(account):
+        logger.info("Retrieving alternate contacts for account %s (%s)...\n", account["Id"], account["Name"])
+
+    def fetch_contacts(account):
+        log_fetch(account)
+        return get_alternate_contacts(
             account_id=account["Id"],
-            region=config["aws"]["default_region"],
+            region=region,
         )
 
-        if "Error" in contacts:
-            logger.error(f"Failed to retrieve contacts for account {account['Id']}: {contacts['Error']}")
-        else:
-            logger.info(
+    # Query accounts concurrently, then report in account order
+    if get_alternate_contacts_for_accounts is not None:
+        import asyncio
+        for account in accounts:
+            log_fetch(account)
+        results = asyncio.run(get_alternate_contacts_for_accounts(
+            [account["Id"] for account in accounts],
+            region,
+            max_concurrency=MAX_ACCOUNT_WORKERS,
+        ))
+    else:
+        results = for_each_account(accounts, fetch_contacts, max_workers=MAX_ACCOUNT_WORKERS)
+    # Report contact blocks in groups of LOG_BATCH_SIZE records, keeping account order
+    # Contact blocks are only built when INFO records will actually be emitted
+    report_contacts = logger.isEnabledFor(logging.INFO)
+    blocks = []
+    for account, contacts in zip(accounts, results):
+        if contacts.error:
+            if blocks:
+                logger.info("\n".join(blocks))
+                blocks = []
+            logger.error("Failed to retrieve contacts for account %s: %s", account["Id"], contacts.error)
+        elif report_contacts:
+            blocks.append(
                 f"Alternate Contacts for Account {account['Id']} ({account['Name']}):\n"
-                f"  Billing Contact:\n{format_contact(contacts['BillingContact'])}\n"
-                f"  Operations Contact:\n{format_contact(contacts['OperationsContact'])}\n"
-                f"  Security Contact:\n{format_contact(contacts['SecurityContact'])}\n"
+                f"  Billing Contact:\n{format_contact(contacts.billing)}\n"
+                f"  Operations Contact:\n{format_contact(contacts.operations)}\n"
+                f"  Security Contact:\n{format_contact(contacts.security)}\n"
             )
+            if len(blocks) >= LOG_BATCH_SIZE:
+                logger.info("\n".join(blocks))
+                blocks = []
+    if blocks:
+        logger.info("\n".join(blocks))
 
 def set_alternate_contacts_for_all_accounts(config):
     """
@@ -149,49 +227,70 @@ def set_alternate_contacts_for_all_accounts(config):
     Returns:
         None
     """
+    from modules.aws_module import for_each_account, set_alternate_contacts
+
+    management_account_id = config["aws"]["management_account_id"]
+    region = config["aws"]["default_region"]
+
     logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
-        account_id=config["aws"]["management_account_id"],
-        region=config["aws"]["default_region"],
+    accounts = get_active_accounts(
+        account_id=management_account_id,
+        region=region,
     )
 
-    logger.info(f"Found {len(accounts)} active accounts. Setting alternate contacts...")
-    for account in accounts:
-        logger.info(f"Setting alternate contacts for account {account['Id']}...")
-        success = set_alternate_contacts(
+    logger.info("Found %d active accounts. Setting alternate contacts...", len(accounts))
+
+    def apply_contacts(account):
+        logger.info("Setting alternate contacts for account %s...", account["Id"])
+        return set_alternate_contacts(
             account_id=account["Id"],
-            region=config["aws"]["default_region"],
+            region=region,
             config=config,
         )
+
+    # Update accounts concurrently, then report in account order
+    results = for_each_account(accounts, apply_contacts, max_workers=MAX_ACCOUNT_WORKERS)
+    for account, success in zip(accounts, results):
         if success:
-            logger.info(f"Successfully set alternate contacts for account {account['Id']}.")
+            logger.info("Successfully set alternate contacts for account %s.", account["Id"])
         else:
-            logger.error(f"Failed to set alternate contacts for account {account['Id']}.")
+            logger.error("Failed to set alternate contacts for account %s.", account["Id"])
 
 def check_s3_buckets_for_all_accounts(config):
     """
     Check for the existence of S3 buckets for all active accounts in AWS Organizations.
     """
+    from modules.aws_module import check_s3_bucket, for_each_account
+
+    management_account_id = config["aws"]["management_account_id"]
+    region = config["aws"]["default_region"]
+    prefix = config["aws"]["security_event_collection_prefix"]
+
     logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
-        account_id=config["aws"]["management_account_id"],
-        region=config["aws"]["default_region"],
+    accounts = get_active_accounts(
+        account_id=management_account_id,
+        region=region,
     )
 
-    logger.info(f"Found {len(accounts)} active accounts. Checking S3 buckets...\n")
-    prefix = config["aws"]["security_event_collection_prefix"]
-    for account in accounts:
-        bucket_name = f"{prefix}-{account['Id']}-{config['aws']['default_region']}"
-        logger.info(f"Checking bucket '{bucket_name}' for account {account['Id']} ({account['Name']})...\n")
+    logger.info("Found %d active accounts. Checking S3 buckets...\n", len(accounts))
+
+    def check_bucket(account):
+        bucket_name = f"{prefix}-{account['Id']}-{region}"
+        logger.info("Checking bucket '%s' for account %s (%s)...\n", bucket_name, account["Id"], account["Name"])
         exists = check_s3_bucket(
             account_id=account["Id"],
-            region=config["aws"]["default_region"],
+            region=region,
             bucket_name=bucket_name,
         )
+        return bucket_name, exists
+
+    # Check accounts concurrently, then report in account order
+    results = for_each_account(accounts, check_bucket, max_workers=MAX_ACCOUNT_WORKERS)
+    for account, (bucket_name, exists) in zip(accounts, results):
         if exists:
-            logger.info(f"Bucket '{bucket_name}' exists in account {account['Id']}.")
+            logger.info("Bucket '%s' exists in account %s.", bucket_name, account["Id"])
         else:
-            logger.info(f"Bucket '{bucket_name}' does not exist in account {account['Id']}.")
+            logger.info("Bucket '%s' does not exist in account %s.", bucket_name, account["Id"])
 
 def get_access_logging_for_all_buckets(config):
     """
@@ -200,61 +299,106 @@ def get_access_logging_for_all_buckets(config):
     Args:
         config (dict): The loaded configuration file.
     """
-    logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
-        account_id=config["aws"]["management_account_id"],
-        region=config["aws"]["default_region"],
+    from modules.aws_module import (
+        for_each_account,
+        get_s3_access_logging,
+        get_s3_bucket_names,
+        get_s3_bucket_region,
+        list_region_names,
+        set_s3_access_logging,
     )
 
-    logger.info(f"Found {len(accounts)} active accounts. Checking S3 buckets for access logging...")
+    management_account_id = config["aws"]["management_account_id"]
+    region = config["aws"]["default_region"]
     prefix = config["aws"]["security_event_collection_prefix"]
-    for account in accounts:
+    controltower_s3_access_logs = config["aws"]["controltower_s3_access_logs"]
 
+    logger.info("Retrieving active accounts in AWS Organizations...")
+    accounts = get_active_accounts(
+        account_id=management_account_id,
+        region=region,
+    )
+
+    logger.info("Found %d active accounts. Checking S3 buckets for access logging...", len(accounts))
+
+    def list_buckets(account):
         buckets=get_s3_bucket_names(
             account_id=account["Id"],
-            region=config["aws"]["default_region"],
+            region=region,
         )
-        logger.info(f"Found {len(buckets)} buckets in account {account['Id']} ({account['Name']}).")
-
-        for bucket in buckets:
-            # get the bucket region to build the access logging name correctly
-            bucket_region = get_s3_bucket_region(
+        logger.info("Found %d buckets in account %s (%s).", len(buckets), account["Id"], account["Name"])
+        return buckets
+
+    # Skip the Control Tower log bucket and the account's access logging bucket in any region,
+    # without looking up the region of either
+    region_names = list_region_names(management_account_id, region)
+
+    def skip_buckets_for(account):
+        return {controltower_s3_access_logs} | {f"{prefix}-{account['Id']}-{name}" for name in region_names}
+
+    # Buckets configured on a recent run are reported from disk instead of asking S3 again
+    access_logging_state = TimestampedCache(ACCESS_LOGGING_CACHE, ACCESS_LOGGING_CACHE_TTL)
+
+    def process_bucket(account, bucket, skip_buckets):
+        if bucket in skip_buckets:
+            logger.info("\t ~ Skipping bucket '%s' in account %s (%s)...", bucket, account["Id"], account["Name"])
+            return
+        state_key = f"{account['Id']}/{bucket}"
+        cached_result = access_logging_state.get(state_key)
+        if cached_result is not None:
+            logger.info("\tAccess Logging for Bucket '%s': %s (cached)", bucket, cached_result)
+            return
+        # get the bucket region to build the access logging name correctly
+        bucket_region = get_s3_bucket_region(
+            account_id=account["Id"],
+            bucket_name=bucket,
+        )
+        # Access logging bucket name
+        access_logging_bucket_name = f"{prefix}-{account['Id']}-{bucket_region}"
+        # Catches the access logging bucket if its region was missing from region_names
+        if bucket == access_logging_bucket_name:
+            logger.info("\t ~ Skipping bucket '%s' in account %s (%s)...", bucket, account["Id"], account["Name"])
+            return
+        result = get_s3_access_logging(
+            account_id=account["Id"],
+            bucket_name=bucket,
+        )
+        # logger.info("\tAccess Logging for Bucket '%s': %s", bucket, result)
+        # if result is "Access Logging Not Configured" the print a warning message
+        if result == "Access Logging Not Configured":
+            logger.warning("\t --> Access Logging is not configured for bucket '%s' in account %s (%s).", bucket, account["Id"], account["Name"])
+            # Set access logging for the bucket
+            set_result = set_s3_access_logging(
                 account_id=account["Id"],
                 bucket_name=bucket,
+                access_logging_bucket=access_logging_bucket_name,
             )
-            # Access logging bucket name
-            access_logging_bucket_name = f"{prefix}-{account['Id']}-{bucket_region}"
-            # if the bucket name matches the controltower_s3_access_logs from config.yaml, skip it
-            # if the bucket being reviewed matches bucket_name, print a comment and skip it.
-            if bucket == config["aws"]["controltower_s3_access_logs"]:
-                logger.info(f"\t ~ Skipping bucket '{bucket}' in account {account['Id']} ({account['Name']})...")
-            elif bucket == access_logging_bucket_name:
-                logger.info(f"\t ~ Skipping bucket '{bucket}' in account {account['Id']} ({account['Name']})...")
-            else:
-                result = get_s3_access_logging(
-                    account_id=account["Id"],
-                    bucket_name=bucket,
-                )
-                # logger.info(f"\tAccess Logging for Bucket '{bucket}': {result}")
-                # if result is "Access Logging Not Configured" the print a warning message
-                if result == "Access Logging Not Configured":
-                    logger.warning(f"\t --> Access Logging is not configured for bucket '{bucket}' in account {account['Id']} ({account['Name']}).")
-                    # Set access logging for the bucket
-                    set_result = set_s3_access_logging(
-                        account_id=account["Id"],
-                        bucket_name=bucket,
-                        access_logging_bucket=access_logging_bucket_name,
-                    )
-                    if set_result:
-                        # if the result is an error, print an error message
-                        if "Error" in set_result:
-                            logger.error(f"\t xxxxx--> Failed to configure Access Logging for bucket '{bucket}' in account {account['Id']} ({account['Name']}).")
-                        else:
-                            logger.info(f"\t --+++--> Access Logging has been configured for bucket '{bucket}' in account {account['Id']} ({account['Name']}).")
-                    else:
-                        logger.error(f"\t xxxxx--> Failed to configure Access Logging for bucket '{bucket}' in account {account['Id']} ({account['Name']}).")
+            if set_result:
+                # if the result is an error, print an error message
+                if "Error" in set_result:
+                    logger.error("\t xxxxx--> Failed to configure Access Logging for bucket '%s' in account %s (%s).", bucket, account["Id"], account["Name"])
                 else:
-                    logger.info(f"\tAccess Logging for Bucket '{bucket}': {result}")
+                    logger.info("\t --+++--> Access Logging has been configured for bucket '%s' in account %s (%s).", bucket, account["Id"], account["Name"])
+                    access_logging_state.set(
+                        state_key,
+                        f"Access logging configured. Destination bucket: {access_logging_bucket_name}",
+                    )
+            else:
+                logger.error("\t xxxxx--> Failed to configure Access Logging for bucket '%s' in account %s (%s).", bucket, account["Id"], account["Name"])
+        elif result.startswith("Access logging configured"):
+            logger.info("\tAccess Logging for Bucket '%s': %s", bucket, result)
+            access_logging_state.set(state_key, result)
+        else:
+            logger.info("\tAccess Logging for Bucket '%s': %s", bucket, result)
+
+    # List buckets per account, then fan out every (account, bucket) pair on one pool
+    bucket_lists = for_each_account(accounts, list_buckets, max_workers=MAX_ACCOUNT_WORKERS)
+    tasks = []
+    for account, buckets in zip(accounts, bucket_lists):
+        skip_buckets = skip_buckets_for(account)
+        tasks.extend((account, bucket, skip_buckets) for bucket in buckets)
+    with ThreadPoolExecutor(max_workers=MAX_BUCKET_WORKERS) as executor:
+        list(executor.map(lambda task: process_bucket(*task), tasks))
 
 def get_s3_bucket_notifications_for_all_buckets(config):
     '''
@@ -268,94 +412,97 @@ def get_s3_bucket_notifications_for_all_buckets(config):
         None
 
     '''
+    from modules.aws_module import for_each_account, get_s3_bucket_names, get_s3_bucket_notifications
+
+    management_account_id = config["aws"]["management_account_id"]
+    region = config["aws"]["default_region"]
+    prefix = config["aws"]["security_event_collection_prefix"]
+
     logger.info("Retrieving active accounts in AWS Organizations...")
-    accounts = list_active_accounts(
-        account_id=config["aws"]["management_account_id"],
-        region=config["aws"]["default_region"],
+    accounts = get_active_accounts(
+        account_id=management_account_id,
+        region=region,
     )
 
-    logger.info(f"Found {len(accounts)} active accounts. Checking S3 buckets...\n")
-    for account in accounts:
+    logger.info("Found %d active accounts. Checking S3 buckets...\n", len(accounts))
+
+    def process_account(account):
         bucket_names = get_s3_bucket_names(
             account_id=account["Id"],
-            region=config["aws"]["default_region"],
+            region=region,
         )
-        logger.info(f"Found {len(bucket_names)} buckets in account {account['Id']} ({account['Name']}).")
+        logger.info("Found %d buckets in account %s (%s).", len(bucket_names), account["Id"], account["Name"])
         for bucket_name in bucket_names:
             get_s3_bucket_notifications(
                 account_id=account["Id"],
                 bucket_name=bucket_name,
-                security_event_collection_prefix=config["aws"]["security_event_collection_prefix"],
+                security_event_collection_prefix=prefix,
             )
 
+    for_each_account(accounts, process_account, max_workers=MAX_ACCOUNT_WORKERS)
+
 
 def main():
     '''
     Main function to parse CLI arguments and run the appropriate action.
     '''
     # Parse CLI arguments
+    refresh_help = "Ignore the cached account list and query AWS Organizations again."
     parser = argparse.ArgumentParser(description="Run connection tests or other operations.")
-    parser.add_argument(
-        "--connection",
-        action="store_true",
+    parser.add_argument("--refresh-accounts", action="store_true", help=refresh_help)
+    # Also accepted after the subcommand; SUPPRESS keeps a flag given before it from being reset
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--refresh-accounts", action="store_true", default=argparse.SUPPRESS, help=refresh_help)
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
+    subparsers.add_parser(
+        "connection",
+        parents=[common],
         help="Test AWS connections for all accounts."
-    )
-    parser.add_argument(
-        "--list-accounts",
-        action="store_true",
+    ).set_defaults(func=test_connections)
+    subparsers.add_parser(
+        "list-accounts",
+        parents=[common],
         help="List all active accounts in AWS Organizations."
-    )
-    parser.add_argument(
-        "--get-alternate-contacts",
-        action="store_true",
+    ).set_defaults(func=list_accounts)
+    subparsers.add_parser(
+        "get-alternate-contacts",
+        parents=[common],
         help="Retrieve alternate contact information for all active accounts.",
-    )
-    parser.add_argument(
-        "--set-alternate-contacts",
-        action="store_true",
+    ).set_defaults(func=get_alternate_contacts_for_all_accounts)
+    subparsers.add_parser(
+        "set-alternate-contacts",
+        parents=[common],
         help="Set alternate contact information."
-    )
-    parser.add_argument(
-        "--s3-check",
-        action="store_true",
+    ).set_defaults(func=set_alternate_contacts_for_all_accounts)
+    subparsers.add_parser(
+        "s3-check",
+        parents=[common],
         help="Check for the existence of specific S3 buckets."
-    )
-    parser.add_argument(
-        "--s3-get-access-logging",
-        action="store_true",
-        help="Query access logging settings for S3 buckets."
-    )
-    parser.add_argument(
-        "--set-s3-access-logging",
-        action="store_true",
-        help="Enable access logging for S3 buckets."
-    )
-    parser.add_argument(
-        "--get-s3-bucket-notifications",
-        action="store_true",
+    ).set_defaults(func=check_s3_buckets_for_all_accounts)
+    subparsers.add_parser(
+        "s3-get-access-logging",
+        parents=[common],
+        help="Query access logging settings for S3 buckets and enable them where missing."
+    ).set_defaults(func=get_access_logging_for_all_buckets)
+    subparsers.add_parser(
+        "get-s3-bucket-notifications",
+        parents=[common],
         help="Query S3 bucket notifications."
-    )
+    ).set_defaults(func=get_s3_bucket_notifications_for_all_buckets)
     args = parser.parse_args()
 
     # Load configuration
     config = load_config()
 
-    if args.connection:
-        test_connections(config)
-    elif args.list_accounts:
-        list_accounts(config)
-    elif args.get_alternate_contacts:
-        get_alternate_contacts_for_all_accounts(config)
-    elif args.set_alternate_contacts:
-        set_alternate_contacts_for_all_accounts(config)
-    elif args.s3_check:
-        check_s3_buckets_for_all_accounts(config)
-    elif args.s3_get_access_logging:
-        get_access_logging_for_all_buckets(config)
-    elif args.get_s3_bucket_notifications:
-        get_s3_bucket_notifications_for_all_buckets(config)
-    else:
-        logger.info("No action specified. Use --help to see available options.")
+    if args.refresh_accounts:
+        clear_cache(accounts_cache_name(config["aws"]["management_account_id"]))
+
+    # AWS helpers only handle botocore errors; anything unexpected is logged once here
+    try:
+        args.func(config)
+    except Exception:
+        logger.exception("An unexpected error occurred while running the requested action.")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -1,117 +1,192 @@
-'''
-Clear Guard Duty findings for a fresh start.
-utils/clear_guard_duty_findings.py
-'''
-import argparse
-import sys
-import logging
-import boto3
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-# Adjust logging for boto3 and botocore
-logging.getLogger("botocore").setLevel(logging.WARNING)
-
-def get_enabled_regions(account_id, aws_default_region):
-    """
-    Retrieve all enabled regions in the specified AWS account.
-
-    Args:
-        account_id (str): AWS account ID.
-        aws_default_region (str): Default AWS region.
-
-    Returns:
-        list: List of enabled regions in the account.
-    """
-    try:
-        session = boto3.Session(profile_name=account_id, region_name=aws_default_region)
-        ec2_client = session.client("ec2")
-        regions = ec2_client.describe_regions(AllRegions=True)["Regions"]
-        enabled_regions = [
-            region["RegionName"]
-            for region in regions
-            if region["OptInStatus"] in ["opt-in-not-required", "opted-in"]
-        ]
-        return enabled_regions
-    except boto3.exceptions.Boto3Error as boto_err:
-        logger.error("Boto3 error fetching enabled regions: %s", boto_err)
-        sys.exit(1)
-
-def archive_guardduty_findings(account_id, region):
-    """
-    Archive all GuardDuty findings in the specified region.
-
-    Args:
-        account_id (str): AWS account ID.
-        region (str): AWS region name.
-
-    Returns:
-        None
-    """
-    try:
-        session = boto3.Session(profile_name=account_id, region_name=region)
-        gd_client = session.client("guardduty")
-
-        detectors = gd_client.list_detectors()["DetectorIds"]
-
-        if not detectors:
-            logger.info("No GuardDuty detectors found in region %s.", region)
-            return
-
-        for detector_id in detectors:
-            next_token = None
-            while True:
-                try:
-                    params = {"DetectorId": detector_id}
-                    if next_token:
-                        params["NextToken"] = next_token
-
-                    findings_response = gd_client.list_findings(**params)
-                    findings = findings_response.get("FindingIds", [])
-
-                    if findings:
-                        gd_client.archive_findings(DetectorId=detector_id, FindingIds=findings)
-                        logger.info("Archived %s findings in region %s for detector %s.", len(findings), region, detector_id)
-                    else:
-                        logger.info("No findings to archive in region %s for detector %s.", region, detector_id)
-
-                    next_token = findings_response.get("NextToken")
-                    if not next_token:
-                        break
-                except boto3.exceptions.Boto3Error as boto_err:
-                    logger.error("Boto3 error processing findings for detector %s in region %s: %s", detector_id, region, boto_err)
-    except boto3.exceptions.Boto3Error as boto_err:
-        logger.error("Boto3 error initializing GuardDuty client in region %s: %s", region, boto_err)
-
-def main():
-    """
-    Main function to archive GuardDuty findings across all enabled regions in the account.
-    """
-    parser = argparse.ArgumentParser(description="Archive GuardDuty findings across all enabled regions.")
-    parser.add_argument("--account", required=True, help="AWS account ID.")
-    parser.add_argument("--region", required=False, help="AWS region to start with.")
-
-    args = parser.parse_args()
-    aws_account_id = args.account
-    aws_region = args.region
-    aws_default_region = "us-east-1"
-
-    # Get all enabled regions in the account
-    if aws_region:
-        logger.info("Region was specified. Processing only the specified region: %s", aws_region)
-        enabled_regions = [aws_region]
-    else:
-        logger.info("Region was not specified. Processing all enabled regions.")
-        enabled_regions = get_enabled_regions(aws_account_id, aws_default_region)
-
-    # Iterate through each enabled region to archive GuardDuty findings
-    for region in enabled_regions:
-        logger.info("Processing: %s %s", aws_account_id, region)
-        archive_guardduty_findings(aws_account_id, region)
-
-    logger.info("GuardDuty findings archiving completed.")
-    sys.exit(0)
-
-if __name__ == "__main__":
-    main()
+'''
+Clear Guard Duty findings for a fresh start.
+utils/clear_guard_duty_findings.py
+'''
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+from botocore.config import Config
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+# Adjust logging for boto3 and botocore
+logging.getLogger("botocore").setLevel(logging.WARNING)
+
+# botocore already sets TCP_NODELAY on its sockets; also keep idle connections alive,
+# size the pool for the concurrent archive calls and back off adaptively when throttled
+AWS_CFG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Maximum number of finding IDs accepted by a single archive_findings call
+ARCHIVE_BATCH_SIZE = 50
+
+# Enabled regions rarely change, so they are reused from disk for a week
+REGIONS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "anan-mesudar")
+REGIONS_CACHE_TTL = 7 * 24 * 60 * 60
+
+def load_cached_regions(account_id):
+    """
+    Load the enabled regions cached on disk for an account.
+
+    Args:
+        account_id (str): AWS account ID.
+
+    Returns:
+        list: The cached regions, or None if the cache is missing, expired or unreadable.
+    """
+    cache_path = os.path.join(REGIONS_CACHE_DIR, f"regions_{account_id}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) >= REGIONS_CACHE_TTL:
+            return None
+        with open(cache_path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_regions(account_id, regions):
+    """
+    Save the enabled regions for an account to the on-disk cache.
+
+    Args:
+        account_id (str): AWS account ID.
+        regions (list): The enabled regions.
+    """
+    cache_path = os.path.join(REGIONS_CACHE_DIR, f"regions_{account_id}.json")
+    try:
+        os.makedirs(REGIONS_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as file:
+            json.dump(regions, file)
+    except OSError as os_err:
+        logger.warning("Unable to cache enabled regions at %s: %s", cache_path, os_err)
+
+@functools.lru_cache(maxsize=16)
+def get_enabled_regions(account_id, aws_default_region, refresh=False):
+    """
+    Retrieve all enabled regions in the specified AWS account.
+
+    Args:
+        account_id (str): AWS account ID.
+        aws_default_region (str): Default AWS region.
+        refresh (bool): Ignore the on-disk cache and query AWS.
+
+    Returns:
+        list: List of enabled regions in the account.
+    """
+    if not refresh:
+        cached_regions = load_cached_regions(account_id)
+        if cached_regions is not None:
+            logger.info("Using %s enabled regions cached for account %s.", len(cached_regions), account_id)
+            return cached_regions
+
+    try:
+        session = boto3.Session(profile_name=account_id, region_name=aws_default_region)
+        ec2_client = session.client("ec2", config=AWS_CFG)
+        regions = ec2_client.describe_regions(AllRegions=True)["Regions"]
+        enabled_regions = [
+            region["RegionName"]
+            for region in regions
+            if region["OptInStatus"] in ["opt-in-not-required", "opted-in"]
+        ]
+        save_cached_regions(account_id, enabled_regions)
+        return enabled_regions
+    except boto3.exceptions.Boto3Error as boto_err:
+        logger.error("Boto3 error fetching enabled regions: %s", boto_err)
+        sys.exit(1)
+
+def archive_guardduty_findings(account_id, region):
+    """
+    Archive all GuardDuty findings in the specified region.
+
+    Args:
+        account_id (str): AWS account ID.
+        region (str): AWS region name.
+
+    Returns:
+        None
+    """
+    try:
+        session = boto3.Session(profile_name=account_id, region_name=region)
+        gd_client = session.client("guardduty", config=AWS_CFG)
+
+        detectors = gd_client.list_detectors()["DetectorIds"]
+
+        if not detectors:
+            logger.info("No GuardDuty detectors found in region %s.", region)
+            return
+
+        def archive(detector_id, finding_ids):
+            gd_client.archive_findings(DetectorId=detector_id, FindingIds=finding_ids)
+            return len(finding_ids)
+
+        paginator = gd_client.get_paginator("list_findings")
+        for detector_id in detectors:
+            try:
+                # Collect finding IDs page by page and archive them in full batches on a small pool
+                pending = []
+                futures = []
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    pages = paginator.paginate(DetectorId=detector_id, PaginationConfig={"PageSize": ARCHIVE_BATCH_SIZE})
+                    for page in pages:
+                        pending.extend(page.get("FindingIds", []))
+                        while len(pending) >= ARCHIVE_BATCH_SIZE:
+                            futures.append(executor.submit(archive, detector_id, pending[:ARCHIVE_BATCH_SIZE]))
+                            pending = pending[ARCHIVE_BATCH_SIZE:]
+                    if pending:
+                        futures.append(executor.submit(archive, detector_id, pending))
+                    archived = sum(future.result() for future in futures)
+
+                if archived:
+                    logger.info("Archived %s findings in region %s for detector %s.", archived, region, detector_id)
+                else:
+                    logger.info("No findings to archive in region %s for detector %s.", region, detector_id)
+            except boto3.exceptions.Boto3Error as boto_err:
+                logger.error("Boto3 error processing findings for detector %s in region %s: %s", detector_id, region, boto_err)
+    except boto3.exceptions.Boto3Error as boto_err:
+        logger.error("Boto3 error initializing GuardDuty client in region %s: %s", region, boto_err)
+
+def main():
+    """
+    Main function to archive GuardDuty findings across all enabled regions in the account.
+    """
+    parser = argparse.ArgumentParser(description="Archive GuardDuty findings across all enabled regions.")
+    parser.add_argument("--account", required=True, help="AWS account ID.")
+    parser.add_argument("--region", required=False, help="AWS region to start with.")
+    parser.add_argument("--refresh-regions", action="store_true", help="Ignore the cached list of enabled regions.")
+
+    args = parser.parse_args()
+    aws_account_id = args.account
+    aws_region = args.region
+    aws_default_region = "us-east-1"
+
+    # Get all enabled regions in the account
+    if aws_region:
+        logger.info("Region was specified. Processing only the specified region: %s", aws_region)
+        enabled_regions = [aws_region]
+    else:
+        logger.info("Region was not specified. Processing all enabled regions.")
+        enabled_regions = get_enabled_regions(aws_account_id, aws_default_region, refresh=args.refresh_regions)
+
+    # Archive GuardDuty findings in every enabled region concurrently; each region
+    # has its own client and endpoint
+    def process_region(region):
+        logger.info("Processing: %s %s", aws_account_id, region)
+        archive_guardduty_findings(aws_account_id, region)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(enabled_regions)))) as executor:
+        list(executor.map(process_region, enabled_regions))
+
+    logger.info("GuardDuty findings archiving completed.")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# utils/file_cache.py
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "anan-mesudar")
+
+def load_cache(name, ttl):
+    """
+    Loads a JSON cache file if it was written less than ttl seconds ago.
+
+    Args:
+        name (str): The cache file name inside CACHE_DIR.
+        ttl (int): The maximum age of the cache in seconds.
+
+    Returns:
+        The cached data, or None if the cache is missing, expired or unreadable.
+    """
+    path = os.path.join(CACHE_DIR, name)
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def save_cache(name, data):
+    """
+    Writes data to a JSON cache file, replacing it atomically. Failures are logged, since
+    the cache only saves work on later runs.
+
+    Args:
+        name (str): The cache file name inside CACHE_DIR.
+        data: JSON-serializable data; other values (e.g. datetimes) are stored as strings.
+    """
+    path = os.path.join(CACHE_DIR, name)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(data, file, default=str)
+        os.replace(f"{path}.tmp", path)
+    except OSError as os_err:
+        logger.warning("Unable to write cache at %s: %s", path, os_err)
+
+def clear_cache(name):
+    """
+    Removes a cache file if it exists.
+
+    Args:
+        name (str): The cache file name inside CACHE_DIR.
+    """
+    try:
+        os.remove(os.path.join(CACHE_DIR, name))
+    except FileNotFoundError:
+        pass
+
+class TimestampedCache:
+    """
+    A JSON cache whose entries are stamped with the time they were stored. Entries older
+    than ttl are dropped on load, and the file is written back at exit only if entries
+    were added.
+
+    Args:
+        name (str): The cache file name inside CACHE_DIR.
+        ttl (int): The maximum age of an entry in seconds.
+    """
+
+    def __init__(self, name, ttl):
+        self._name = name
+        cutoff = time.time() - ttl
+        cached = load_cache(name, ttl) or {}
+        self._entries = {key: entry for key, entry in cached.items() if entry[1] > cutoff}
+        self._dirty = False
+        self._lock = threading.Lock()
+        atexit.register(self.save)
+
+    def get(self, key):
+        """
+        Returns the value stored for key, or None if there is no fresh entry.
+        """
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def set(self, key, value):
+        """
+        Stores value for key, stamped with the current time.
+        """
+        with self._lock:
+            self._entries[key] = [value, time.time()]
+            self._dirty = True
+
+    def save(self):
+        """
+        Writes the cache to disk if entries were added since it was loaded or last saved.
+        """
+        with self._lock:
+            if self._dirty:
+                save_cache(self._name, self._entries)
+                self._dirty = False
@@ -0,0 +1,25 @@
+# utils/http_session.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def build_session():
+    """
+    Builds a requests session that reuses pooled TLS connections and retries transient
+    server errors with backoff over the same pool.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session